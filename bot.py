@@ -1,51 +1,545 @@
 from atproto import Client, models
 from openai import OpenAI
+import httpx
 import os
+import sys
+import atexit
+import signal
 from dotenv import load_dotenv
 import yaml
 import glob
 from pathlib import Path
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 import logging
-from datetime import datetime, timedelta, timezone
+from logging.handlers import RotatingFileHandler, MemoryHandler
+from datetime import datetime, timedelta
 from colorama import Fore, Style, init
 import json
+import orjson
+import re
 import time
 import random
+import hashlib
+import calendar
+import bisect
+import itertools
+import tempfile
+import sqlite3
+import uuid
 import emoji
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml not available, fall back to the pure-Python loader
+    from yaml import SafeLoader as _YamlLoader
+
 init()  # Initialize colorama
 
+ENV_VAR_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+# Substring match (so "technology" and "codebase" count) in one case-insensitive scan
+TECH_PATTERN = re.compile(r'code|programming|tech', re.IGNORECASE)
+
+# Single-codepoint emojis known to the emoji package, shared by every bot
+EMOJI_CHARS = frozenset(key for key in emoji.EMOJI_DATA if len(key) == 1)
+
+# Peak posting hours (adjust based on your audience): morning, lunch and evening on
+# weekdays, more relaxed on weekends. Bit weekday * 24 + hour is set for each peak hour.
+PEAK_HOURS = {
+    'weekday': ((7, 9), (12, 14), (17, 22)),
+    'weekend': ((9, 22),)
+}
+PEAK_HOURS_MASK = sum(
+    1 << (day * 24 + hour)
+    for day in range(7)
+    for start, end in PEAK_HOURS['weekend' if day >= 5 else 'weekday']
+    for hour in range(start, end)
+)
+
+# Original post prompts by post type
+POST_PROMPTS = {
+    'question': "Create an engaging question about {topic} that encourages discussion. "
+                "Include these hashtags where relevant: {tags}",
+    
+    'tip': "Share a helpful tip or insight about {topic}. "
+           "Make it actionable and include these hashtags where relevant: {tags}",
+    
+    'discussion': "Start a discussion about {topic} with a thought-provoking statement. "
+                  "Include these hashtags where relevant: {tags}",
+    
+    'trend': "Share an interesting trend or development in {topic}. "
+             "Include these hashtags where relevant: {tags}"
+}
+
+# System messages shared by every request of their kind
+HASHTAG_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a social media expert. Generate relevant hashtags."
+}
+AUTHOR_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You analyze social media users from their bio and recent posts.\n"
+               "Return ONLY a JSON object with the keys 'interests' and 'writing_style'.\n"
+               "'interests' is a list of key interests and topics from the bio (empty if there is no bio).\n"
+               "'writing_style' is one of 'casual', 'formal', 'friendly', 'professional', or 'enthusiastic'.\n"
+               'Example: {"interests": ["coffee", "small business"], "writing_style": "casual"}'
+}
+WRITING_STYLES = {'casual', 'formal', 'friendly', 'professional', 'enthusiastic'}
+
+# Reply prompt used when engagement_style.system_prompt is not configured
+DEFAULT_REPLY_PROMPT = (
+    "You're a casual social media user. Keep responses natural and friendly.\n"
+    "Use casual language and don't sound like a bot.\n"
+    "Keep it under 200 chars."
+)
+REPLY_BATCH_INSTRUCTIONS = (
+    "You will receive a JSON list of posts, each with an 'id', the author's 'vibe' and the post 'text'.\n"
+    "Write one reply per post in your style, matching that post's vibe.\n"
+    'Return ONLY a JSON list like: [{"id": 0, "reply": "..."}]'
+)
+
+# Colored prefixes are built once instead of on every print
+SUCCESS_PREFIX = f"{Fore.GREEN}[SUCCESS] "
+ERROR_PREFIX = f"{Fore.RED}[ERROR] "
+WARNING_PREFIX = f"{Fore.YELLOW}[WARNING] "
+ACTION_PREFIX = f"{Fore.BLUE}[ACTION] "
+COLOR_SUFFIX = Style.RESET_ALL + "\n"
+
 def print_success(message):
     """Print a success message in green"""
-    print(f"{Fore.GREEN}[SUCCESS] {message}{Style.RESET_ALL}")
+    if not QUIET:
+        sys.stdout.write(SUCCESS_PREFIX + str(message) + COLOR_SUFFIX)
 
 def print_error(message):
     """Print an error message in red"""
-    print(f"{Fore.RED}[ERROR] {message}{Style.RESET_ALL}")
+    if not QUIET:
+        sys.stdout.write(ERROR_PREFIX + str(message) + COLOR_SUFFIX)
 
 def print_warning(message):
     """Print a warning message in yellow"""
-    print(f"{Fore.YELLOW}[WARNING] {message}{Style.RESET_ALL}")
+    if not QUIET:
+        sys.stdout.write(WARNING_PREFIX + str(message) + COLOR_SUFFIX)
 
 def print_action(message):
     """Print an action message in blue"""
-    print(f"{Fore.BLUE}[ACTION] {message}{Style.RESET_ALL}")
+    if not QUIET:
+        sys.stdout.write(ACTION_PREFIX + str(message) + COLOR_SUFFIX)
+
+def print_report(message):
+    """Print a plain multi-line report"""
+    if not QUIET:
+        sys.stdout.write(str(message) + "\n")
+
+
+def serialize_set(value):
+    """orjson default hook: store sets as sorted lists"""
+    if isinstance(value, set):
+        return sorted(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def iso_to_epoch(value):
+    """Convert an ISO-8601 timestamp to epoch seconds, slicing the common UTC 'Z' form directly"""
+    if len(value) >= 20 and value[-1] == 'Z' and value[4] == '-' and value[10] == 'T':
+        return calendar.timegm((
+            int(value[0:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19]), 0, 0, 0
+        ))
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+
+
+def to_epoch(value):
+    """Epoch seconds for a stored timestamp, parsing the older str(datetime) form"""
+    if isinstance(value, str):
+        return int(datetime.fromisoformat(value).timestamp())
+    return value
+
+
+def next_midnight_timestamp():
+    """Epoch seconds of the next local midnight"""
+    tomorrow = datetime.now().date() + timedelta(days=1)
+    return datetime.combine(tomorrow, datetime.min.time()).timestamp()
+
+
+def load_yaml_cached(path):
+    """Parse a yaml file, reusing a JSON sidecar cache when the source is unchanged.
+
+    Returns the parsed data and whether the raw file contains any ${...} references.
+    """
+    cache_path = f"{path}.cache.json"
+    with open(path, 'rb') as file:
+        raw = file.read()
+    content_hash = hashlib.md5(raw).hexdigest()
+    has_env_refs = b'${' in raw
+
+    # Only trust the cache if it is newer than the yaml and was built from the same bytes
+    try:
+        if os.stat(cache_path).st_mtime >= os.stat(path).st_mtime:
+            with open(cache_path, 'rb') as f:
+                cached = orjson.loads(f.read())
+            if cached.get('content_hash') == content_hash:
+                return cached['config'], has_env_refs
+    except (OSError, ValueError, KeyError):
+        pass
+
+    data = yaml.load(raw, Loader=_YamlLoader)
+
+    # Write the cache atomically so a concurrent reader never sees a partial file
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or '.', suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            # Non-string yaml keys are written as strings, as the json module did
+            f.write(orjson.dumps({'content_hash': content_hash, 'config': data}, option=orjson.OPT_NON_STR_KEYS))
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print_warning(f"Could not write config cache {cache_path}: {e}")
+
+    return data, has_env_refs
+
+
+def substitute_env_vars(value):
+    """Recursively replace ${VAR} references with values from the environment"""
+    if isinstance(value, str):
+        return ENV_VAR_PATTERN.sub(lambda match: os.getenv(match.group(1), ''), value)
+    if isinstance(value, dict):
+        return {key: substitute_env_vars(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [substitute_env_vars(item) for item in value]
+    return value
+
+
+class RateLimiter:
+    """Thread-safe token bucket used to pace API calls across worker threads"""
+
+    def __init__(self, rate, burst=1, stop_event=None):
+        self.rate = rate  # tokens per second
+        self.capacity = burst
+        self.stop_event = stop_event or threading.Event()  # set to release waiting callers
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available and consume it; returns False if stopped while waiting"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+            if self.stop_event.wait(wait):
+                return False
+
+
+class ReplyBatcher:
+    """Queues reply targets and generates their replies with one OpenAI call per batch"""
+
+    def __init__(self, bot, batch_size=8, flush_interval=30, max_queue=100):
+        self.bot = bot
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval  # seconds to wait for a batch to fill up
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.pending_uris = set()
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, name=f"{bot.slug}_replies", daemon=True)
+        self.thread.start()
+
+    def enqueue(self, post):
+        """Queue a post for a reply; returns False if it is already queued or the queue is full"""
+        with self.lock:
+            if post.uri in self.pending_uris:
+                return False
+            try:
+                self.queue.put_nowait(post)
+            except queue.Full:
+                return False
+            self.pending_uris.add(post.uri)
+            return True
+
+    def run(self):
+        """Flush a batch when it is full or flush_interval has passed since its first post"""
+        while not self.stop_event.is_set():
+            try:
+                batch = [self.queue.get(timeout=1)]
+            except queue.Empty:
+                continue
+
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self.bot.reply_to_batch(batch)
+            except Exception as e:
+                print_error(f"[{self.bot.name}] Reply batch failed: {e}")
+                self.bot.logger.error(f"Reply batch failed: {e}")
+            finally:
+                with self.lock:
+                    self.pending_uris.difference_update(post.uri for post in batch)
+
+    def stop(self):
+        """Stop the flush thread; posts still queued are dropped"""
+        self.stop_event.set()
+
+
+class AuthorAnalysisQueue:
+    """Analyzes author interests and writing style through the OpenAI Batch API.
+
+    Requests and results live in a per-bot SQLite database, so batches that were
+    submitted before a restart are still collected afterwards.
+    """
+
+    def __init__(self, bot, poll_interval=300, max_age=7 * 86400):
+        self.bot = bot
+        self.poll_interval = poll_interval
+        self.max_age = max_age  # re-analyze authors after this many seconds
+        self.pending_dir = os.path.join('data', 'pending_batches')
+        os.makedirs(self.pending_dir, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(bot.author_analysis_file, check_same_thread=False)
+        with self.db:
+            self.db.execute("""
+                CREATE TABLE IF NOT EXISTS author_analysis (
+                    did TEXT PRIMARY KEY,
+                    interests TEXT,
+                    writing_style TEXT,
+                    updated_at REAL
+                )
+            """)
+            self.db.execute("""
+                CREATE TABLE IF NOT EXISTS pending_requests (
+                    custom_id TEXT PRIMARY KEY,
+                    did TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    batch_id TEXT
+                )
+            """)
+
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, name=f"{bot.slug}_analysis", daemon=True)
+        self.thread.start()
+
+    def lookup(self, did):
+        """Return cached {'interests', 'writing_style'} for an author, or None on a miss"""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT interests, writing_style, updated_at FROM author_analysis WHERE did = ?",
+                (did,)
+            ).fetchone()
+        if row is None or time.time() - row[2] > self.max_age:
+            return None
+        return {
+            'interests': json.loads(row[0]) if row[0] else None,
+            'writing_style': row[1]
+        }
+
+    def enqueue(self, did, bio, recent_posts):
+        """Queue one combined interests/style request for an author unless one is already pending"""
+        body = self.bot.author_request(bio, recent_posts)
+
+        with self.lock, self.db:
+            if self.db.execute("SELECT 1 FROM pending_requests WHERE did = ? LIMIT 1", (did,)).fetchone():
+                return
+            # Authors with nothing to analyze are cached as defaults straight away
+            if body is None:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO author_analysis (did, interests, writing_style, updated_at) VALUES (?, NULL, NULL, ?)",
+                    (did, time.time())
+                )
+                return
+            self.db.execute(
+                "INSERT OR REPLACE INTO pending_requests (custom_id, did, kind, body) VALUES (?, ?, ?, ?)",
+                (f"author:{did}", did, 'author', json.dumps(body))
+            )
+
+    def run(self):
+        """Submit queued requests and collect finished batches every poll_interval"""
+        while not self.stop_event.wait(self.poll_interval):
+            try:
+                self.submit_pending()
+                self.collect_results()
+            except Exception as e:
+                print_warning(f"[{self.bot.name}] Author analysis batch error: {e}")
+                self.bot.logger.error(f"Author analysis batch error: {e}")
+
+    def submit_pending(self):
+        """Upload all unsubmitted requests as one batch job"""
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT custom_id, body FROM pending_requests WHERE batch_id IS NULL"
+            ).fetchall()
+        if not rows:
+            return
+
+        path = os.path.join(self.pending_dir, f"{self.bot.slug}_{uuid.uuid4().hex}.jsonl")
+        try:
+            with open(path, 'w') as f:
+                for custom_id, body in rows:
+                    f.write(json.dumps({
+                        'custom_id': custom_id,
+                        'method': 'POST',
+                        'url': '/v1/chat/completions',
+                        'body': json.loads(body)
+                    }) + '\n')
+
+            with open(path, 'rb') as f:
+                input_file = self.bot.openai_client.files.create(file=f, purpose='batch')
+            batch = self.bot.openai_client.batches.create(
+                input_file_id=input_file.id,
+                endpoint='/v1/chat/completions',
+                completion_window='24h'
+            )
+        finally:
+            os.remove(path)
+
+        with self.lock, self.db:
+            self.db.executemany(
+                "UPDATE pending_requests SET batch_id = ? WHERE custom_id = ?",
+                [(batch.id, custom_id) for custom_id, _ in rows]
+            )
+        print_action(f"[{self.bot.name}] Submitted author analysis batch {batch.id} ({len(rows)} requests)")
+
+    def collect_results(self):
+        """Store results of finished batches and drop requests whose batch ended"""
+        with self.lock:
+            batch_ids = [row[0] for row in self.db.execute(
+                "SELECT DISTINCT batch_id FROM pending_requests WHERE batch_id IS NOT NULL"
+            )]
+
+        for batch_id in batch_ids:
+            batch = self.bot.openai_client.batches.retrieve(batch_id)
+            if batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+                continue
+
+            results = {}
+            if batch.status == 'completed' and batch.output_file_id:
+                output = self.bot.openai_client.files.content(batch.output_file_id).text
+                for line in output.splitlines():
+                    if not line.strip():
+                        continue
+                    item = json.loads(line)
+                    try:
+                        results[item['custom_id']] = item['response']['body']['choices'][0]['message']['content']
+                    except (KeyError, IndexError, TypeError):
+                        continue
+
+            with self.lock, self.db:
+                rows = self.db.execute(
+                    "SELECT custom_id, did FROM pending_requests WHERE batch_id = ?",
+                    (batch_id,)
+                ).fetchall()
+                for custom_id, did in rows:
+                    # Authors whose requests failed keep the defaults until max_age passes
+                    self.db.execute(
+                        "INSERT OR IGNORE INTO author_analysis (did, updated_at) VALUES (?, ?)",
+                        (did, time.time())
+                    )
+                    content = results.get(custom_id)
+                    if content is None:
+                        continue
+                    analysis = self.bot.parse_author_analysis(content)
+                    interests = json.dumps(analysis['interests']) if analysis['interests'] else None
+                    self.db.execute(
+                        "UPDATE author_analysis SET interests = ?, writing_style = ?, updated_at = ? WHERE did = ?",
+                        (interests, analysis['writing_style'], time.time(), did)
+                    )
+                self.db.execute("DELETE FROM pending_requests WHERE batch_id = ?", (batch_id,))
+
+            print_action(f"[{self.bot.name}] Collected author analysis batch {batch_id} ({batch.status})")
+
+    def stop(self):
+        """Stop the polling thread; pending requests stay in the database for the next start"""
+        self.stop_event.set()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after ttl seconds"""
+
+    def __init__(self, maxsize=10_000, ttl=3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()  # key: (expires_at, value)
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return a live cached value, or default if missing or expired"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return default
+            if entry[0] < time.monotonic():
+                del self.entries[key]
+                return default
+            self.entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value):
+        """Store a value, evicting the least recently used entries past maxsize"""
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def pop(self, key):
+        """Drop a single entry if present"""
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        """Drop every entry"""
+        with self.lock:
+            self.entries.clear()
 
 
 load_dotenv()
 
+# QUIET=1 silences the console helpers; the log files are unaffected
+QUIET = os.getenv('QUIET') == '1'
+
 class BlueskyBot:
-    def __init__(self, config_path):
+    def __init__(self, config_path, openai_client=None, stop_event=None):
         """Initialize bot with configuration from yaml file"""
         self.config = self.load_config(config_path)
         self.name = self.config['name']
-        self.client = Client()
-        self.openai_client = OpenAI()
+        self.slug = self.name.lower().replace(' ', '_')  # used in every data/log filename
+        
+        # Per-bot data files
+        self.followed_users_file = f"data/{self.slug}_followed_users.json"
+        self.engagement_stats_file = f"data/{self.slug}_engagement_stats.json"
+        self.post_history_file = f"data/{self.slug}_post_history.jsonl"
+        self.engagement_history_file = f"data/{self.slug}_engagement_history.json"
+        self.engagement_log_file = f"data/{self.slug}_engagement_history.jsonl"
+        self.engagement_config_file = f"data/{self.slug}_engagement_config.json"
+        self.follower_snapshots_file = f"data/{self.slug}_follower_snapshots.jsonl"
+        self.follower_meta_file = f"data/{self.slug}_follower_meta.json"
+        self.author_analysis_file = f"data/{self.slug}_author_analysis.sqlite3"
+        
+        # Bots started from main share one OpenAI client and its connection pool;
+        # the Bluesky client holds this account's session, so it's created in login()
+        self.openai_client = openai_client or OpenAI()
         
         # Set up bot-specific logging
         self.setup_logging()
         
+        # Log in before starting any background workers, so a failed login leaves nothing running
+        self.login()
+        
         # Initialize from yaml config
         self.daily_limits = {
             'follows': 750,
@@ -58,15 +552,95 @@ class BlueskyBot:
         if 'limits' in self.config and 'daily' in self.config['limits']:
             self.daily_limits.update(self.config['limits']['daily'])
 
+        # Shared by every bot started from main; setting it ends the run loop and wakes every wait
+        self.stop_event = stop_event or threading.Event()
+
+        # Likes and reposts run on a small worker pool, paced by a shared token bucket
+        limits = self.config.get('limits', {})
+        concurrency = limits.get('concurrency', 4)
+        actions_per_minute = limits.get('actions_per_minute', 20)
+        if not isinstance(actions_per_minute, (int, float)) or actions_per_minute <= 0:
+            raise ValueError(f"limits.actions_per_minute must be a positive number, got {actions_per_minute!r}")
+        self.executor = ThreadPoolExecutor(
+            max_workers=concurrency,
+            thread_name_prefix=f"{self.slug}_worker"
+        )
+        self.action_limiter = RateLimiter(
+            actions_per_minute / 60,
+            burst=concurrency,
+            stop_event=self.stop_event
+        )
+        # Reply context lookups get their own pool so they never queue behind rate-limited actions;
+        # it is left running at shutdown so a reply batch still in flight can finish its lookups
+        self.context_executor = ThreadPoolExecutor(
+            max_workers=2,
+            thread_name_prefix=f"{self.slug}_context"
+        )
+        self.state_lock = threading.RLock()
+
+        # Replies are generated in batches on a background thread
+        engagement_style = self.config.get('engagement_style', {})
+        self.reply_batcher = ReplyBatcher(
+            self,
+            batch_size=engagement_style.get('reply_batch_size', 8),
+            flush_interval=engagement_style.get('reply_batch_seconds', 30)
+        )
+
+        # Author interests/style are analyzed through the OpenAI Batch API
+        self.author_analysis = AuthorAnalysisQueue(self)
+
+        # Profile/feed lookups are memoized for 15 minutes
+        self.profile_cache = TTLCache(maxsize=10_000, ttl=900)
+        self.feed_cache = TTLCache(maxsize=10_000, ttl=900)
+
         self.search_terms = self.config['engagement']['search_terms']
         self.hashtags = self.config['engagement']['hashtags']
+        # Post prompts rotate through the hashtags in a shuffled order
+        self.hashtag_cycle = itertools.cycle(random.sample(self.hashtags, len(self.hashtags)))
         self.bio_keywords = self.config['engagement']['bio_keywords']
+        # Match every bio keyword in a single case-insensitive scan
+        self.bio_keyword_pattern = re.compile(
+            '|'.join(re.escape(keyword) for keyword in self.bio_keywords),
+            re.IGNORECASE
+        ) if self.bio_keywords else None
         self.system_prompt = self.config['content']['system_prompt']
         
+        # Per-bot system messages are built once and reused by every request
+        self.reply_system_message = {
+            "role": "system",
+            "content": engagement_style.get('system_prompt', DEFAULT_REPLY_PROMPT) + "\n" + REPLY_BATCH_INSTRUCTIONS
+        }
+        self.reply_temperature = engagement_style.get('temperature', 0.9)
+        self.max_emojis = engagement_style.get('max_emojis')  # optional per-reply emoji cap
+        self.post_system_message = {
+            "role": "system",
+            "content": f"{self.system_prompt}\nCreate engaging content that encourages interaction."
+        }
+        self.trending_tags = []
+        self.trending_tags_fetched_at = 0
+        
+        # Term pools sampled every cycle; the discovery pool is rebuilt only when trending tags refresh
+        self.search_terms_tuple = tuple(self.search_terms)
+        self.discovery_terms = tuple(set(self.search_terms_tuple))
+        self.discovery_terms_built_at = self.trending_tags_fetched_at
+        
         # Initialize tracking
         self.followed_users = self.load_followed_users()
         self.engagement_stats = self.load_engagement_stats()
         self.post_history = self.load_post_history()
+        self.engagement_history = self.load_engagement_history()
+        self.migrate_follower_stats()
+
+        # State files are written in batches by a background flusher instead of on every change
+        self.dirty = {'followed': False, 'stats': False, 'history': False}
+        self.flush_stop = threading.Event()
+        self.flush_thread = threading.Thread(
+            target=self.flush_loop,
+            name=f"{self.slug}_flusher",
+            daemon=True
+        )
+        self.flush_thread.start()
+        atexit.register(self.flush_state)
         
         # Control flags
         self.running = False
@@ -74,7 +648,6 @@ class BlueskyBot:
 
         # Add follower count tracking
         self.last_follower_count = 0
-        self.login()  # Ensure we're logged in
         try:
             self.last_follower_count = self.get_follower_count()
         except Exception as e:
@@ -82,18 +655,18 @@ class BlueskyBot:
 
     def load_config(self, config_path):
         """Load and process yaml configuration"""
-        with open(config_path, 'r') as file:
-            config = yaml.safe_load(file)
-            
-            # Replace environment variables in credentials
-            config['credentials']['username'] = os.getenv(config['credentials']['username'].replace('${', '').replace('}', ''))
-            config['credentials']['app_password'] = os.getenv(config['credentials']['app_password'].replace('${', '').replace('}', ''))
-            
-            return config
+        # The cache holds the unresolved config, so credentials never land on disk
+        config, has_env_refs = load_yaml_cached(config_path)
+        
+        # Replace environment variables, skipping the walk entirely when the file has none
+        if has_env_refs:
+            config = substitute_env_vars(config)
+        
+        return config
 
     def setup_logging(self):
         """Set up bot-specific logging"""
-        log_filename = f"logs/{self.name.lower().replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.log"
+        log_filename = f"logs/{self.slug}_{datetime.now().strftime('%Y%m%d')}.log"
         os.makedirs('logs', exist_ok=True)
         
         self.logger = logging.getLogger(self.name)
@@ -101,9 +674,13 @@ class BlueskyBot:
         
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         
-        file_handler = logging.FileHandler(log_filename)
+        file_handler = RotatingFileHandler(log_filename, maxBytes=10_000_000, backupCount=5, delay=True)
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+        
+        # Buffer records and write them in batches; errors are flushed immediately
+        buffered_handler = MemoryHandler(1000, flushLevel=logging.ERROR, target=file_handler)
+        self.logger.addHandler(buffered_handler)
+        atexit.register(buffered_handler.flush)
 
     def login(self):
         """Login to Bluesky"""
@@ -124,16 +701,33 @@ class BlueskyBot:
 
     def load_followed_users(self):
         """Load or create followed users tracking file"""
-        filename = f"data/{self.name.lower().replace(' ', '_')}_followed_users.json"
+        filename = self.followed_users_file
         os.makedirs('data', exist_ok=True)
         
         try:
-            with open(filename, 'r') as f:
-                return json.load(f)
+            with open(filename, 'rb') as f:
+                data = orjson.loads(f.read())
+            # Users are stored as parallel sorted arrays; older files use a did -> info mapping
+            users = data.get('users', {})
+            if 'dids' in users:
+                data['users'] = dict(zip(
+                    users['dids'],
+                    ({'handle': handle, 'followed_at': followed_at}
+                     for handle, followed_at in zip(users['handles'], users['times']))
+                ))
+            # Intern dids and handles so repeated references share one string
+            interned_users = {}
+            for did, info in data['users'].items():
+                info['handle'] = sys.intern(info['handle'])
+                interned_users[sys.intern(did)] = info
+            data['users'] = interned_users
+            # Keep the blacklist as a set in memory; it is only listified on save
+            data['blacklist'] = set(data.get('blacklist', []))
+            return data
         except FileNotFoundError:
             # Initialize new followed users tracking
             initial_data = {
-                'users': {},  # did: {'handle': handle, 'followed_at': timestamp}
+                'users': {},  # did: {'handle': handle, 'followed_at': timestamp}; saved as sorted arrays
                 'blacklist': set(),  # users we don't want to follow again
                 'last_reset': str(datetime.now())
             }
@@ -145,55 +739,65 @@ class BlueskyBot:
         if data is None:
             data = self.followed_users
             
-        # Convert set to list for JSON serialization
-        if 'blacklist' in data:
-            data['blacklist'] = list(data['blacklist'])
+        # Store users as parallel sorted arrays instead of one object per did
+        users = data['users']
+        dids = sorted(users)
+        serialized = dict(data, users={
+            'dids': dids,
+            'handles': [users[did]['handle'] for did in dids],
+            'times': [users[did]['followed_at'] for did in dids]
+        })
             
-        filename = f"data/{self.name.lower().replace(' ', '_')}_followed_users.json"
+        filename = self.followed_users_file
         try:
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(filename, 'wb') as f:
+                # Serialize the blacklist set without converting it in place
+                f.write(orjson.dumps(serialized, default=serialize_set, option=orjson.OPT_INDENT_2))
         except Exception as e:
             print_error(f"Failed to save followed users: {e}")
             logging.error(f"Error saving followed users: {e}")
 
     def add_followed_user(self, did, handle):
         """Add a user to our followed list"""
-        self.followed_users['users'][did] = {
-            'handle': handle,
-            'followed_at': str(datetime.now())
-        }
-        self.save_followed_users()
+        with self.state_lock:
+            self.followed_users['users'][sys.intern(did)] = {
+                'handle': sys.intern(handle),
+                'followed_at': str(datetime.now())
+            }
+            self.dirty['followed'] = True
 
     def blacklist_user(self, did):
         """Add a user to our blacklist"""
-        if isinstance(self.followed_users['blacklist'], list):
-            self.followed_users['blacklist'] = set(self.followed_users['blacklist'])
-        self.followed_users['blacklist'].add(did)
-        if did in self.followed_users['users']:
-            del self.followed_users['users'][did]
-        self.save_followed_users()
+        with self.state_lock:
+            self.followed_users['blacklist'].add(did)
+            if did in self.followed_users['users']:
+                del self.followed_users['users'][did]
+            self.dirty['followed'] = True
 
     def remove_followed_user(self, did):
         """Remove a user from our followed list"""
-        if did in self.followed_users['users']:
-            del self.followed_users['users'][did]
-            self.save_followed_users()
+        with self.state_lock:
+            if did in self.followed_users['users']:
+                del self.followed_users['users'][did]
+                self.dirty['followed'] = True
 
     def load_engagement_stats(self):
         """Load or create engagement stats tracking file"""
-        filename = f"data/{self.name.lower().replace(' ', '_')}_engagement_stats.json"
+        filename = self.engagement_stats_file
         os.makedirs('data', exist_ok=True)
         
+        # Whatever we load covers today, so the next rollover is at the coming midnight
+        self.next_stats_reset = next_midnight_timestamp()
+        
         try:
-            with open(filename, 'r') as f:
-                stats = json.load(f)
+            with open(filename, 'rb') as f:
+                stats = orjson.loads(f.read())
                 
-                # Reset stats if it's a new day
-                last_reset = datetime.fromisoformat(stats.get('last_reset', '2000-01-01'))
-                if datetime.now().date() > last_reset.date():
-                    stats = self.reset_engagement_stats()
-                return stats['counts']
+            # Reset stats if it's a new day
+            last_reset = datetime.fromisoformat(stats.get('last_reset', '2000-01-01'))
+            if datetime.now().date() > last_reset.date():
+                return self.reset_engagement_stats()
+            return stats['counts']
                 
         except FileNotFoundError:
             return self.reset_engagement_stats()
@@ -213,6 +817,22 @@ class BlueskyBot:
         self.save_engagement_stats(stats['counts'])
         return stats['counts']
 
+    def maybe_reset_stats(self):
+        """Start a fresh day of engagement stats once midnight has passed"""
+        if time.time() < self.next_stats_reset:
+            return
+        with self.state_lock:
+            self.engagement_stats = self.reset_engagement_stats()
+            self.dirty['stats'] = False
+        self.next_stats_reset = next_midnight_timestamp()
+        print_action(f"[{self.name}] Reset daily engagement stats")
+        
+        # Nightly compaction of the append-only post history; old engagement
+        # periods are dropped by the next snapshot
+        self.prune_post_history()
+        with self.state_lock:
+            self.dirty['history'] = True
+
     def save_engagement_stats(self, stats=None):
         """Save current engagement stats to file"""
         try:
@@ -224,9 +844,9 @@ class BlueskyBot:
                 'counts': stats
             }
             
-            filename = f"data/{self.name.lower().replace(' ', '_')}_engagement_stats.json"
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
+            filename = self.engagement_stats_file
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
                 
         except Exception as e:
             print_error(f"Failed to save engagement stats: {e}")
@@ -235,11 +855,12 @@ class BlueskyBot:
     def increment_stat(self, stat_name):
         """Safely increment a stat and save it"""
         try:
-            if stat_name in self.engagement_stats:
-                self.engagement_stats[stat_name] += 1
-                self.save_engagement_stats()
-                return True
-            return False
+            with self.state_lock:
+                if stat_name in self.engagement_stats:
+                    self.engagement_stats[stat_name] += 1
+                    self.dirty['stats'] = True
+                    return True
+                return False
         except Exception as e:
             logging.error(f"Error incrementing stat {stat_name}: {e}")
             return False
@@ -248,65 +869,167 @@ class BlueskyBot:
         """Check if we can perform an action based on daily limits"""
         return self.engagement_stats.get(action_type, 0) < self.daily_limits.get(action_type, 0)
 
+    def reserve_action(self, action_type):
+        """Atomically check the daily limit and count the action; returns False if the limit is reached"""
+        with self.state_lock:
+            if not self.can_perform_action(action_type):
+                return False
+            self.engagement_stats[action_type] = self.engagement_stats.get(action_type, 0) + 1
+            self.dirty['stats'] = True
+            return True
+
+    def release_action(self, action_type):
+        """Give back an action reserved with reserve_action that was not performed"""
+        with self.state_lock:
+            self.engagement_stats[action_type] = max(0, self.engagement_stats.get(action_type, 0) - 1)
+            self.dirty['stats'] = True
+
     def load_post_history(self):
-        """Load or create post history tracking file"""
-        filename = f"data/{self.name.lower().replace(' ', '_')}_post_history.json"
+        """Load post history from its append-only log, skipping entries older than 7 days"""
+        filename = self.post_history_file
         os.makedirs('data', exist_ok=True)
         
+        # Post text and authors stay in the log; memory only holds what the checks need
+        history = {
+            'posts': {},  # uri: epoch seconds
+            'last_post': None  # epoch seconds of our latest post
+        }
+        cutoff = time.time() - 7 * 86400
+        needs_compaction = False
+        migrated = None
+        
+        def keep(entry):
+            history['posts'][sys.intern(entry['uri'])] = entry['ts']
+            history['last_post'] = max(history['last_post'] or 0, entry['ts'])
+        
         try:
-            with open(filename, 'r') as f:
-                history = json.load(f)
-                
-                # Clean up old entries (older than 7 days)
-                current_time = datetime.now()
-                history['posts'] = {
-                    uri: data for uri, data in history['posts'].items()
-                    if (current_time - datetime.fromisoformat(data['timestamp'])).days <= 7
-                }
-                
-                self.save_post_history(history)
-                return history
-                
+            with open(filename, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        needs_compaction = True  # e.g. a line cut short by a crash
+                        continue
+                    if entry['ts'] < cutoff:
+                        needs_compaction = True
+                        continue
+                    keep(entry)
+                    
         except FileNotFoundError:
-            # Initialize new post history
-            initial_data = {
-                'posts': {},  # uri: {'text': text, 'timestamp': timestamp}
-                'last_post': None
-            }
-            self.save_post_history(initial_data)
-            return initial_data
+            needs_compaction = True
+            # Migrate the older single-document history file
+            migrated = []
+            try:
+                with open(f"data/{self.slug}_post_history.json", 'rb') as f:
+                    legacy = orjson.loads(f.read())
+                for uri, data in legacy.get('posts', {}).items():
+                    ts = int(datetime.fromisoformat(data['timestamp']).timestamp())
+                    if ts >= cutoff:
+                        entry = {'uri': uri, 'text': data['text'], 'ts': ts}
+                        if data.get('author'):
+                            entry['author'] = data['author']
+                        keep(entry)
+                        migrated.append(entry)
+            except FileNotFoundError:
+                pass
+        
+        if needs_compaction:
+            self.compact_post_history(history, migrated)
+        self.post_history_log = open(filename, 'ab')
+        return history
 
-    def save_post_history(self, history=None):
-        """Save post history to file"""
+    def compact_post_history(self, history=None, entries=None):
+        """Rewrite the post history log so it only holds the entries we keep"""
+        if history is None:
+            history = self.post_history
+            
+        filename = self.post_history_file
         try:
-            if history is None:
-                history = self.post_history
-                
-            filename = f"data/{self.name.lower().replace(' ', '_')}_post_history.json"
-            with open(filename, 'w') as f:
-                json.dump(history, f, indent=2)
+            with self.state_lock:
+                fd, tmp_path = tempfile.mkstemp(dir='data', suffix='.tmp')
+                with os.fdopen(fd, 'wb') as out:
+                    if entries is not None:
+                        for entry in entries:
+                            out.write(orjson.dumps(entry) + b'\n')
+                    else:
+                        # Post text only lives on disk, so copy the kept lines from the current log
+                        with open(filename, 'rb') as f:
+                            for line in f:
+                                try:
+                                    entry = orjson.loads(line)
+                                except orjson.JSONDecodeError:
+                                    continue
+                                if history['posts'].get(entry['uri']) == entry['ts']:
+                                    out.write(line if line.endswith(b'\n') else line + b'\n')
+                os.replace(tmp_path, filename)
                 
+                # The append handle still points at the replaced file
+                if getattr(self, 'post_history_log', None):
+                    self.post_history_log.close()
+                    self.post_history_log = open(filename, 'ab')
+                    
         except Exception as e:
-            print_error(f"Failed to save post history: {e}")
-            logging.error(f"Error saving post history: {e}")
+            print_error(f"Failed to compact post history: {e}")
+            logging.error(f"Error compacting post history: {e}")
+
+    def prune_post_history(self):
+        """Drop history entries older than 7 days and compact the log"""
+        cutoff = time.time() - 7 * 86400
+        with self.state_lock:
+            self.post_history['posts'] = {
+                uri: ts for uri, ts in self.post_history['posts'].items()
+                if ts >= cutoff
+            }
+            self.compact_post_history()
 
-    def add_post_to_history(self, uri, text):
+    def add_post_to_history(self, uri, text, author_did=None):
         """Add a post to our history"""
-        self.post_history['posts'][uri] = {
-            'text': text,
-            'timestamp': str(datetime.now())
+        with self.state_lock:
+            timestamp = int(time.time())
+            record = {
+                'text': text,
+                'ts': timestamp
+            }
+            if author_did:
+                record['author'] = author_did
+            uri = sys.intern(uri)
+            self.post_history['posts'][uri] = timestamp
+            self.post_history['last_post'] = timestamp
+            
+            # Appending one line keeps each add O(1) regardless of history size
+            self.post_history_log.write(orjson.dumps(dict(record, uri=uri)) + b'\n')
+            self.post_history_log.flush()
+
+    def flush_loop(self, interval=5, snapshot_interval=60):
+        """Periodically write any state that changed since the last flush"""
+        last_snapshot = time.time()
+        while not self.flush_stop.wait(interval):
+            # Logged state is already on disk, so its snapshot is rewritten less often
+            snapshots = time.time() - last_snapshot >= snapshot_interval
+            self.flush_state(snapshots)
+            if snapshots:
+                last_snapshot = time.time()
+
+    def flush_state(self, snapshots=True):
+        """Write all dirty state files to disk"""
+        savers = {
+            'followed': self.save_followed_users,
+            'stats': self.save_engagement_stats
         }
-        self.post_history['last_post'] = str(datetime.now())
-        self.save_post_history()
+        if snapshots:
+            savers['history'] = self.save_engagement_history
+        with self.state_lock:
+            for key, save in savers.items():
+                if self.dirty[key]:
+                    self.dirty[key] = False
+                    save()
 
     def has_posted_recently(self, minutes=15):
         """Check if we've posted within the last X minutes"""
         if not self.post_history['last_post']:
             return False
             
-        last_post_time = datetime.fromisoformat(self.post_history['last_post'])
-        time_since_post = datetime.now() - last_post_time
-        return time_since_post.total_seconds() < (minutes * 60)
+        return time.time() - self.post_history['last_post'] < (minutes * 60)
 
     def has_replied_to_post(self, uri):
         """Check if we've already replied to a post"""
@@ -316,15 +1039,11 @@ class BlueskyBot:
         """Find new users to follow using multiple strategies"""
         try:
             print_action(f"[{self.name}] Finding new users to follow...")
-            potential_users = set()
+            seen_dids = set()
+            candidates = []  # (indexed_at, did, handle), one entry per author
             
-            # Get current time for filtering
-            current_time = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
-            week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%dT%H:%M:%SZ")
-            
-            # Get trending hashtags
-            trending_tags = self.get_trending_hashtags()
-            search_terms = list(set(self.search_terms + trending_tags))
+            # Search terms merged with trending hashtags
+            search_terms = self.get_discovery_terms()
             
             # Search by terms
             for term in random.sample(search_terms, min(5, len(search_terms))):
@@ -338,38 +1057,51 @@ class BlueskyBot:
                     
                     if hasattr(search_results, 'posts'):
                         for post in search_results.posts:
-                            if hasattr(post, 'author'):
-                                # Check if user has posted recently
-                                if self.is_recently_active_user(post.author.did):
-                                    potential_users.add((post.author.did, post.author.handle))
+                            if not hasattr(post, 'author') or post.author.did in seen_dids:
+                                continue
+                            seen_dids.add(post.author.did)
+                            candidates.append((getattr(post, 'indexed_at', None) or '', post.author.did, post.author.handle))
                                 
                 except Exception as e:
                     print_warning(f"[{self.name}] Search failed for term {term}: {e}")
                     continue
                 
-                time.sleep(random.uniform(1, 2))
-
-            # Filter and return results
-            filtered_users = self.filter_users_by_engagement(potential_users)
+                if self.stop_event.wait(random.uniform(1, 2)):
+                    return []
+
+            # Score the most recently active authors first so scoring can stop at the limit
+            candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+            filtered_users = self.score_candidates(
+                [(did, handle) for _, did, handle in candidates],
+                limit=limit
+            )
             
             print_success(f"[{self.name}] Found {len(filtered_users)} new users to follow")
-            return filtered_users[:limit]
+            return filtered_users
             
         except Exception as e:
             print_error(f"[{self.name}] Failed to find new users: {e}")
             self.logger.error(f"Error finding new users: {e}")
             return []
 
+    def get_discovery_terms(self):
+        """Return search terms plus trending hashtags, rebuilding only after the hashtags refresh"""
+        trending_tags = self.get_trending_hashtags()
+        if self.discovery_terms_built_at != self.trending_tags_fetched_at:
+            self.discovery_terms = tuple(set(self.search_terms_tuple + tuple(trending_tags)))
+            self.discovery_terms_built_at = self.trending_tags_fetched_at
+        return self.discovery_terms
+
     def get_trending_hashtags(self):
-        """Get trending hashtags using OpenAI"""
+        """Get trending hashtags using OpenAI, cached for the 4-hour analysis window"""
+        if time.time() - self.trending_tags_fetched_at < 14400:  # 4 hours
+            return self.trending_tags
+
         try:
             response = self.openai_client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a social media expert. Generate relevant hashtags."
-                    },
+                    HASHTAG_SYSTEM_MESSAGE,
                     {
                         "role": "user",
                         "content": f"Generate 5 trending hashtags related to these topics: {', '.join(self.search_terms)}"
@@ -380,36 +1112,23 @@ class BlueskyBot:
             )
             
             hashtags = response.choices[0].message.content.strip().split()
-            return [tag.strip('#') for tag in hashtags if tag.startswith('#')]
+            self.trending_tags = [tag.strip('#') for tag in hashtags if tag.startswith('#')]
+            self.trending_tags_fetched_at = time.time()
+            return self.trending_tags
             
         except Exception as e:
             print_warning(f"[{self.name}] Error getting trending hashtags: {e}")
             return []
 
-    def is_recently_active_user(self, user_did):
-        """Check if user has posted in the last few days"""
-        try:
-            profile = self.client.app.bsky.actor.get_profile({'actor': user_did})
-            feed = self.client.app.bsky.feed.get_author_feed({'actor': user_did, 'limit': 1})
-            
-            if hasattr(feed, 'feed') and feed.feed:
-                latest_post = feed.feed[0]
-                post_time = datetime.fromisoformat(latest_post.post.indexed_at.replace('Z', '+00:00'))
-                days_since_post = (datetime.now(timezone.utc) - post_time).days
-                return days_since_post <= 3  # Active in last 3 days
-                
-            return False
-            
-        except Exception as e:
-            print_warning(f"[{self.name}] Error checking user activity: {e}")
-            return False
-
-    def filter_users_by_engagement(self, users):
-        """Filter users based on their engagement metrics"""
+    def score_candidates(self, users, limit=None):
+        """Keep users with good engagement metrics who have posted in the last few days"""
         filtered_users = []
+        now = time.time()
         for user_did, handle in users:
+            if limit is not None and len(filtered_users) >= limit:
+                break
             try:
-                profile = self.client.app.bsky.actor.get_profile({'actor': user_did})
+                profile = self.get_profile_cached(user_did)
                 
                 # Calculate engagement metrics
                 follower_ratio = profile.followers_count / profile.follows_count if profile.follows_count > 0 else 0
@@ -418,17 +1137,40 @@ class BlueskyBot:
                 # Score the user
                 score = (follower_ratio * 0.5) + (posts_per_day * 0.5)
                 
+                # Only fetch the feed for users that pass the score threshold
                 if score > 1.0:  # Adjust threshold as needed
-                    filtered_users.append((user_did, handle))
+                    feed = self.get_author_feed_cached(user_did, limit=1)
+                    if hasattr(feed, 'feed') and feed.feed:
+                        post_time = iso_to_epoch(feed.feed[0].post.indexed_at)
+                        if (now - post_time) // 86400 <= 3:  # Active in last 3 days
+                            filtered_users.append((user_did, handle))
                     
             except Exception as e:
-                print_warning(f"[{self.name}] Error filtering user {handle}: {e}")
+                print_warning(f"[{self.name}] Error scoring user {handle}: {e}")
                 continue
                 
-            time.sleep(random.uniform(0.5, 1))
+            if self.stop_event.wait(random.uniform(0.5, 1)):
+                break
             
         return filtered_users
 
+    def get_profile_cached(self, actor):
+        """Fetch an actor's profile, reusing a copy fetched in the last few minutes"""
+        profile = self.profile_cache.get(actor)
+        if profile is None:
+            profile = self.client.app.bsky.actor.get_profile({'actor': actor})
+            self.profile_cache.set(actor, profile)
+        return profile
+
+    def get_author_feed_cached(self, actor, limit):
+        """Fetch an actor's recent feed, reusing a copy fetched in the last few minutes"""
+        key = (actor, limit)
+        feed = self.feed_cache.get(key)
+        if feed is None:
+            feed = self.client.app.bsky.feed.get_author_feed({'actor': actor, 'limit': limit})
+            self.feed_cache.set(key, feed)
+        return feed
+
     def follow_user(self, did, handle):
         """Follow a user and track the action"""
         try:
@@ -446,12 +1188,11 @@ class BlueskyBot:
     def should_follow_user(self, author):
         """Determine if we should follow a user based on their profile"""
         try:
-            if not hasattr(author, 'description'):
+            if not hasattr(author, 'description') or self.bio_keyword_pattern is None:
                 return False
                 
             # Check if any of our keywords appear in their bio
-            bio_text = author.description.lower()
-            if any(keyword.lower() in bio_text for keyword in self.bio_keywords):
+            if self.bio_keyword_pattern.search(author.description or ''):
                 return True
                 
             return False
@@ -468,9 +1209,11 @@ class BlueskyBot:
             print_success(f"[{self.name}] Bot started successfully")
             self.logger.info("Bot started successfully")
 
-            while self.running:
+            while self.running and not self.stop_event.is_set():
                 try:
                     if not self.paused:
+                        self.maybe_reset_stats()
+
                         # Track follower count
                         self.track_follower_count()
 
@@ -491,38 +1234,18 @@ class BlueskyBot:
                             posts = self.find_posts_to_comment(limit=1000)
                             print_action(f"[{self.name}] Found {len(posts)} posts to potentially engage with")
                             
-                            for post_data in posts:
-                                # Like posts
-                                if self.can_perform_action('likes'):
-                                    try:
-                                        print_action(f"[{self.name}] Attempting to like post by {post_data['author'].handle}")
-                                        self.client.like(post_data['uri'], post_data['cid'])
-                                        self.increment_stat('likes')
-                                        self.track_engagement_result('likes')
-                                        print_success(f"[{self.name}] Liked post by {post_data['author'].handle}")
-                                        time.sleep(random.uniform(2, 5))
-                                    except Exception as e:
-                                        print_error(f"[{self.name}] Failed to like post: {e}")
-
-                                # Repost some posts
-                                if self.can_perform_action('reposts') and random.random() < 0.3:
-                                    try:
-                                        print_action(f"[{self.name}] Attempting to repost by {post_data['author'].handle}")
-                                        self.client.repost(post_data['uri'], post_data['cid'])
-                                        self.increment_stat('reposts')
-                                        self.track_engagement_result('reposts')
-                                        print_success(f"[{self.name}] Reposted post by {post_data['author'].handle}")
-                                        time.sleep(random.uniform(2, 5))
-                                    except Exception as e:
-                                        print_error(f"[{self.name}] Failed to repost: {e}")
-
-                                # Reply to some posts
-                                if self.can_perform_action('replies') and not self.has_replied_to_post(post_data['uri']):
-                                    if random.random() < 0.4:
-                                        print_action(f"[{self.name}] Attempting to reply to {post_data['author'].handle}")
-                                        self.create_engaging_reply(post_data['post'])
-                                        self.track_engagement_result('replies')
-                                        time.sleep(random.uniform(5, 10))
+                            # Like and repost concurrently, paced by the shared rate limiter
+                            list(self.executor.map(self.engage_with_post, posts))
+
+                            # Queue some posts for replies; they are generated and sent in batches (one per uri)
+                            reply_targets = list({
+                                post_data['uri']: post_data for post_data in posts
+                                if not self.has_replied_to_post(post_data['uri']) and random.random() < 0.4
+                            }.values())
+                            remaining_replies = self.daily_limits.get('replies', 0) - self.engagement_stats.get('replies', 0)
+                            for post_data in reply_targets[:max(0, remaining_replies)]:
+                                if self.enqueue_reply(post_data['post']):
+                                    print_action(f"[{self.name}] Queued reply to {post_data['author'].handle}")
 
                         # Find and follow new users
                         if self.can_perform_action('follows'):
@@ -530,17 +1253,18 @@ class BlueskyBot:
                             for user_did, handle in new_users:
                                 if self.follow_user(user_did, handle):
                                     self.track_engagement_result('follows')
-                                    time.sleep(random.uniform(30, 60))
+                                    if self.stop_event.wait(random.uniform(30, 60)):
+                                        break
 
                         # Sleep between cycles
                         sleep_time = random.uniform(180, 300)  # 3-5 minutes
                         print_action(f"[{self.name}] Sleeping for {int(sleep_time/60)} minutes...")
-                        time.sleep(sleep_time)
+                        self.stop_event.wait(sleep_time)
 
                 except Exception as e:
                     self.logger.error(f"Error in main loop: {e}")
                     print_error(f"[{self.name}] Error in main loop: {e}")
-                    time.sleep(300)  # Sleep for 5 minutes on error
+                    self.stop_event.wait(300)  # Sleep for 5 minutes on error
 
         except KeyboardInterrupt:
             print_action(f"[{self.name}] Shutting down gracefully...")
@@ -549,6 +1273,46 @@ class BlueskyBot:
             self.logger.error(f"Fatal error: {e}")
             print_error(f"[{self.name}] Fatal error: {e}")
             self.running = False
+        finally:
+            self.executor.shutdown(wait=False)
+            self.reply_batcher.stop()
+            self.author_analysis.stop()
+            self.flush_stop.set()
+            self.flush_state()
+
+    def engage_with_post(self, post_data):
+        """Like and occasionally repost a post; runs on the worker pool"""
+        # Posts still queued when the bot is stopping are skipped
+        if self.stop_event.is_set():
+            return
+            
+        # Like posts; the slot is reserved up front so concurrent workers can't overshoot the limit
+        if self.reserve_action('likes'):
+            try:
+                if not self.action_limiter.acquire():
+                    self.release_action('likes')
+                    return
+                print_action(f"[{self.name}] Attempting to like post by {post_data['author'].handle}")
+                self.client.like(post_data['uri'], post_data['cid'])
+                self.track_engagement_result('likes')
+                print_success(f"[{self.name}] Liked post by {post_data['author'].handle}")
+            except Exception as e:
+                self.release_action('likes')
+                print_error(f"[{self.name}] Failed to like post: {e}")
+
+        # Repost some posts
+        if random.random() < 0.3 and self.reserve_action('reposts'):
+            try:
+                if not self.action_limiter.acquire():
+                    self.release_action('reposts')
+                    return
+                print_action(f"[{self.name}] Attempting to repost by {post_data['author'].handle}")
+                self.client.repost(post_data['uri'], post_data['cid'])
+                self.track_engagement_result('reposts')
+                print_success(f"[{self.name}] Reposted post by {post_data['author'].handle}")
+            except Exception as e:
+                self.release_action('reposts')
+                print_error(f"[{self.name}] Failed to repost: {e}")
 
     def find_posts_to_comment(self, limit=20):
         """Find posts worth engaging with"""
@@ -557,7 +1321,7 @@ class BlueskyBot:
             relevant_posts = []
             
             # Search by terms from config
-            for search_term in random.sample(self.search_terms, min(3, len(self.search_terms))):
+            for search_term in random.sample(self.search_terms_tuple, min(3, len(self.search_terms_tuple))):
                 try:
                     print_action(f"[{self.name}] Searching posts with term: {search_term}")
                     search_results = self.client.app.bsky.feed.search_posts({
@@ -594,7 +1358,8 @@ class BlueskyBot:
                     print_warning(f"[{self.name}] Search failed for term {search_term}: {e}")
                     continue
                     
-                time.sleep(random.uniform(1, 2))
+                if self.stop_event.wait(random.uniform(1, 2)):
+                    return []
 
             # Shuffle and limit results
             random.shuffle(relevant_posts)
@@ -609,7 +1374,7 @@ class BlueskyBot:
             return []
 
     def is_worth_commenting(self, post):
-        """Determine if a post is worth engaging with based on user influence"""
+        """Determine if a post is worth engaging with"""
         try:
             # Debug logging
             print_action(f"[{self.name}] Evaluating post...")
@@ -633,29 +1398,7 @@ class BlueskyBot:
                 print_warning(f"[{self.name}] Already replied to post")
                 return False
 
-            # Check user influence
-            try:
-                profile = self.client.app.bsky.actor.get_profile({'actor': post.author.did})
-                follower_count = profile.followers_count
-                following_count = profile.follows_count
-                
-                # Calculate engagement ratio
-                engagement_ratio = follower_count / following_count if following_count > 0 else 0
-                
-                # Prioritize users with good engagement ratios
-                if engagement_ratio > 1.5:  # They have 50% more followers than following
-                    print_success(f"[{self.name}] High-influence user found: {post.author.handle}")
-                    return True
-                    
-                # Also engage with active users
-                if hasattr(profile, 'posts_count') and profile.posts_count > 100:
-                    print_success(f"[{self.name}] Active user found: {post.author.handle}")
-                    return True
-                    
-            except Exception as e:
-                print_warning(f"[{self.name}] Error checking user influence: {e}")
-                
-            # Default to basic engagement criteria
+            # Every post that passes the checks above is worth engaging with
             return True
             
         except Exception as e:
@@ -663,50 +1406,75 @@ class BlueskyBot:
             self.logger.error(f"Error evaluating post: {e}")
             return False
 
-    def create_engaging_reply(self, post):
-        """Create a natural, casual reply using OpenAI with custom personality"""
+    def enqueue_reply(self, post):
+        """Queue a post for the reply batcher"""
+        return self.reply_batcher.enqueue(post)
+
+    def reply_to_batch(self, posts):
+        """Generate replies for a batch of posts in one call and send them"""
+        contexts = [self.build_post_context(post) for post in posts]
+        replies = self.generate_replies(posts, contexts)
+        
+        for index, post in enumerate(posts):
+            reply_text = replies.get(index)
+            if not reply_text:
+                print_warning(f"[{self.name}] No reply generated for post by {post.author.handle}")
+                continue
+            if not self.can_perform_action('replies'):
+                print_warning(f"[{self.name}] Daily reply limit reached, dropping remaining batch")
+                break
+            if self.send_reply(post, reply_text):
+                self.track_engagement_result('replies')
+
+    def generate_replies(self, posts, contexts):
+        """Create natural, casual replies for several posts in a single OpenAI request"""
         try:
-            # Build context about the post and author
-            context = self.build_post_context(post)
-            
-            # Get custom system prompt from config, or use default
-            system_prompt = self.config.get('engagement_style', {}).get('system_prompt', """
-                You're a casual social media user. Keep responses natural and friendly.
-                Use casual language and don't sound like a bot.
-                Keep it under 200 chars.
-            """)
-            
-            # Get custom temperature from config, or use default
-            temperature = self.config.get('engagement_style', {}).get('temperature', 0.9)
+            batch = [
+                {'id': index, 'vibe': context['writing_style'], 'text': post.record.text}
+                for index, (post, context) in enumerate(zip(posts, contexts))
+            ]
 
             response = self.openai_client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
-                    {
-                        "role": "system",
-                        "content": f"{system_prompt}\nMatch their vibe: {context['writing_style']}"
-                    },
+                    self.reply_system_message,
                     {
                         "role": "user",
-                        "content": f"Reply to this in your style: {post.record.text}"
+                        "content": json.dumps(batch, ensure_ascii=False)
                     }
                 ],
-                max_tokens=100,
-                temperature=temperature
+                max_tokens=100 * len(posts),
+                temperature=self.reply_temperature
             )
             
-            reply_text = response.choices[0].message.content.strip()
+            content = response.choices[0].message.content.strip()
             
-            # Ensure reply isn't too long
-            if len(reply_text) > 280:
-                reply_text = reply_text[:277] + "..."
+            # Tolerate the model wrapping its answer in a code fence
+            if content.startswith('```'):
+                content = content.strip('`')
+                if content.startswith('json'):
+                    content = content[4:]
             
-            # Optional: Enforce emoji limit if specified
-            max_emojis = self.config.get('engagement_style', {}).get('max_emojis')
-            if max_emojis:
-                reply_text = self.limit_emojis(reply_text, max_emojis)
+            return {
+                int(item['id']): str(item['reply']).strip()
+                for item in json.loads(content)
+                if isinstance(item, dict) and 'id' in item and item.get('reply')
+            }
+            
+        except Exception as e:
+            print_error(f"[{self.name}] Error generating replies: {e}")
+            self.logger.error(f"Error generating replies: {e}")
+            return {}
+
+    def send_reply(self, post, reply_text):
+        """Post a generated reply and track it"""
+        try:
+            # Enforce the length and optional emoji limits
+            reply_text = self.finalize_reply(reply_text, 280, self.max_emojis)
             
             # Create the reply
+            if not self.action_limiter.acquire():
+                return False
             result = self.client.send_post(
                 text=reply_text,
                 reply_to={"root": {"uri": post.uri, "cid": post.cid}, 
@@ -714,33 +1482,44 @@ class BlueskyBot:
             )
             
             if result:
-                self.add_post_to_history(post.uri, reply_text)
+                self.add_post_to_history(post.uri, reply_text, post.author.did)
                 self.increment_stat('replies')
                 print_success(f"[{self.name}] Created reply: {reply_text[:50]}...")
+                return True
+            return False
             
         except Exception as e:
             print_error(f"[{self.name}] Error creating reply: {e}")
             self.logger.error(f"Error creating reply: {e}")
+            return False
 
-    def limit_emojis(self, text, max_emojis):
-        """Limit the number of emojis in the text"""
-        # Convert text to list of characters
-        chars = list(text)
+    def finalize_reply(self, text, max_len, max_emojis=None):
+        """Drop emojis past max_emojis and truncate to max_len characters in a single pass"""
+        # Pure-ASCII text has no emojis to limit, so only the length matters
+        if not max_emojis or text.isascii():
+            return text if len(text) <= max_len else text[:max_len - 3] + "..."
+            
         emoji_count = 0
         result = []
         
-        for char in chars:
-            if emoji.is_emoji(char):
-                if emoji_count < max_emojis:
-                    result.append(char)
-                    emoji_count += 1
-            else:
-                result.append(char)
+        for char in text:
+            if char in EMOJI_CHARS:
+                if emoji_count >= max_emojis:
+                    continue
+                emoji_count += 1
+            result.append(char)
+            
+            # Stop as soon as the reply is known to be too long
+            if len(result) > max_len:
+                return ''.join(result[:max_len - 3]) + "..."
                 
         return ''.join(result)
 
     def build_post_context(self, post):
-        """Analyze post and author to build context for personalization"""
+        """Analyze post and author to build context for personalization.
+
+        Runs its fetches on the context pool, so it must not be called from a context pool worker.
+        """
         try:
             context = {
                 'author_interests': [],
@@ -749,17 +1528,20 @@ class BlueskyBot:
                 'value_add': 'insights'
             }
             
-            # Analyze author's profile and recent posts
-            profile = self.client.app.bsky.actor.get_profile({'actor': post.author.did})
-            recent_posts = self.get_recent_posts(post.author.did)
-            
-            # Extract interests from bio
-            if hasattr(profile, 'description'):
-                context['author_interests'] = self.extract_interests(profile.description)
-            
-            # Analyze writing style from recent posts
-            if recent_posts:
-                context.update(self.analyze_writing_style(recent_posts))
+            # Interests and writing style come from the batch analysis cache; on a miss the
+            # author is queued for the next batch and the defaults are used for now
+            analysis = self.author_analysis.lookup(post.author.did)
+            if analysis is not None:
+                profile = self.get_profile_cached(post.author.did)
+                context['author_interests'] = analysis['interests'] or self.search_terms
+                context['writing_style'] = analysis['writing_style'] or 'casual'
+            else:
+                # Fetch the profile and recent posts at the same time
+                profile_future = self.context_executor.submit(self.get_profile_cached, post.author.did)
+                recent_posts_future = self.context_executor.submit(self.get_recent_posts, post.author.did)
+                profile = profile_future.result()
+                recent_posts = recent_posts_future.result()
+                self.author_analysis.enqueue(post.author.did, getattr(profile, 'description', None), recent_posts)
             
             # Determine best value-add approach
             context['value_add'] = self.determine_value_add(post, profile)
@@ -778,10 +1560,7 @@ class BlueskyBot:
     def get_recent_posts(self, author_did, limit=5):
         """Get author's recent posts for analysis"""
         try:
-            feed = self.client.app.bsky.feed.get_author_feed({
-                'actor': author_did,
-                'limit': limit
-            })
+            feed = self.get_author_feed_cached(author_did, limit=limit)
             
             if hasattr(feed, 'feed'):
                 return [post.post.record.text for post in feed.feed 
@@ -792,101 +1571,48 @@ class BlueskyBot:
             print_warning(f"[{self.name}] Error getting recent posts: {e}")
             return []
 
-    def extract_interests(self, bio):
-        """Extract interests from user's bio using OpenAI"""
-        try:
-            # Check if bio is empty or None
-            if not bio or not isinstance(bio, str):
-                print_warning(f"[{self.name}] Empty or invalid bio, using default interests")
-                return self.search_terms
-                
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "Extract key interests and topics from this bio. Return as comma-separated list."
-                    },
-                    {
-                        "role": "user",
-                        "content": bio
-                    }
-                ],
-                max_tokens=50,
-                temperature=0.5
-            )
-            
-            interests = response.choices[0].message.content.strip().split(',')
-            return [interest.strip() for interest in interests]
+    def author_request(self, bio, posts):
+        """Chat completion arguments for a combined interests/style analysis, or None if there is nothing to analyze"""
+        bio = bio.strip() if isinstance(bio, str) else ''
+        posts_text = "\n".join(filter(None, posts or []))  # Filter out None/empty posts
+        if not bio and not posts_text.strip():
+            return None
             
-        except Exception as e:
-            print_warning(f"[{self.name}] Error extracting interests: {e}")
-            return self.search_terms
+        return {
+            'model': "gpt-4o-mini",
+            'messages': [
+                AUTHOR_SYSTEM_MESSAGE,
+                {
+                    "role": "user",
+                    "content": f"Bio: {bio}\n\nRecent posts: {posts_text[:500]}"  # Limit text length
+                }
+            ],
+            'response_format': {'type': 'json_object'},
+            'max_tokens': 100,
+            'temperature': 0.3  # Lower temperature for more consistent output
+        }
 
-    def analyze_writing_style(self, posts):
-        """Analyze writing style from recent posts using OpenAI"""
+    def parse_author_analysis(self, content):
+        """Validate a combined analysis response into {'interests', 'writing_style'}"""
         try:
-            # Check if posts list is empty
-            if not posts:
-                return {'writing_style': 'casual'}
-                
-            posts_text = "\n".join(filter(None, posts))  # Filter out None/empty posts
+            analysis = json.loads(content)
+        except ValueError as e:
+            print_warning(f"[{self.name}] JSON parsing error: {str(e)}")
+            analysis = {}
+        if not isinstance(analysis, dict):
+            analysis = {}
             
-            # Check if we have any text to analyze
-            if not posts_text.strip():
-                return {'writing_style': 'casual'}
-                
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """You are a writing style analyzer. 
-                        Return ONLY a JSON object with a single key 'writing_style' and one of these values:
-                        'casual', 'formal', 'friendly', 'professional', or 'enthusiastic'.
-                        Example: {"writing_style": "casual"}"""
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Analyze this writing style: {posts_text[:500]}"  # Limit text length
-                    }
-                ],
-                max_tokens=50,
-                temperature=0.3  # Lower temperature for more consistent output
-            )
+        interests = analysis.get('interests')
+        if isinstance(interests, list):
+            interests = [str(interest).strip() for interest in interests if str(interest).strip()]
+        else:
+            interests = None
             
-            try:
-                # Get the response content
-                content = response.choices[0].message.content.strip()
-                
-                # If response doesn't start with {, assume it's not JSON
-                if not content.startswith('{'):
-                    print_warning(f"[{self.name}] Invalid JSON response: {content}")
-                    return {'writing_style': 'casual'}
-                
-                # Parse JSON response
-                analysis = json.loads(content)
-                
-                # Validate the response format
-                if 'writing_style' not in analysis:
-                    print_warning(f"[{self.name}] Missing writing_style in response")
-                    return {'writing_style': 'casual'}
-                    
-                # Ensure writing_style is one of our expected values
-                valid_styles = {'casual', 'formal', 'friendly', 'professional', 'enthusiastic'}
-                if analysis['writing_style'] not in valid_styles:
-                    print_warning(f"[{self.name}] Invalid writing style: {analysis['writing_style']}")
-                    return {'writing_style': 'casual'}
-                
-                return analysis
-                
-            except json.JSONDecodeError as e:
-                print_warning(f"[{self.name}] JSON parsing error: {str(e)}")
-                return {'writing_style': 'casual'}
+        writing_style = analysis.get('writing_style')
+        if writing_style not in WRITING_STYLES:
+            writing_style = 'casual'
             
-        except Exception as e:
-            print_warning(f"[{self.name}] Error analyzing writing style: {str(e)}")
-            return {'writing_style': 'casual'}
+        return {'interests': interests or None, 'writing_style': writing_style}
 
     def determine_value_add(self, post, profile):
         """Determine best way to add value based on post and profile"""
@@ -898,7 +1624,7 @@ class BlueskyBot:
                 return 'thoughtful discussion'
             
             # For technical posts, provide insights
-            if any(term in post.record.text.lower() for term in ['code', 'programming', 'tech']):
+            if TECH_PATTERN.search(post.record.text):
                 return 'technical insights'
             
             # For questions, provide helpful answers
@@ -918,6 +1644,11 @@ class BlueskyBot:
             if self.has_posted_recently(minutes=30):
                 return
                 
+            # Check if it's a good time to post before paying for the generation
+            if not self.is_good_posting_time():
+                print_action(f"[{self.name}] Waiting for better posting time...")
+                return
+                
             # Randomly select post type with weights
             post_type = random.choices(
                 ['question', 'tip', 'discussion', 'trend'],
@@ -930,10 +1661,7 @@ class BlueskyBot:
             response = self.openai_client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
-                    {
-                        "role": "system",
-                        "content": f"{self.system_prompt}\nCreate engaging content that encourages interaction."
-                    },
+                    self.post_system_message,
                     {
                         "role": "user",
                         "content": prompt
@@ -945,11 +1673,6 @@ class BlueskyBot:
             
             post_text = response.choices[0].message.content.strip()
             
-            # Check if it's a good time to post
-            if not self.is_good_posting_time():
-                print_action(f"[{self.name}] Waiting for better posting time...")
-                return
-                
             # Post the content
             result = self.client.post(text=post_text)
             self.add_post_to_history(result.uri, post_text)
@@ -965,42 +1688,16 @@ class BlueskyBot:
     def get_post_prompt(self, post_type):
         """Generate appropriate prompt based on post type"""
         topic = random.choice(self.search_terms)
-        hashtags = random.sample(self.hashtags, min(3, len(self.hashtags)))
-        
-        prompts = {
-            'question': f"Create an engaging question about {topic} that encourages discussion. "
-                       f"Include these hashtags where relevant: {', '.join(hashtags)}",
-            
-            'tip': f"Share a helpful tip or insight about {topic}. "
-                  f"Make it actionable and include these hashtags where relevant: {', '.join(hashtags)}",
-            
-            'discussion': f"Start a discussion about {topic} with a thought-provoking statement. "
-                         f"Include these hashtags where relevant: {', '.join(hashtags)}",
-            
-            'trend': f"Share an interesting trend or development in {topic}. "
-                    f"Include these hashtags where relevant: {', '.join(hashtags)}"
-        }
-        
-        return prompts.get(post_type, prompts['discussion'])
+        tags = ', '.join(itertools.islice(self.hashtag_cycle, min(3, len(self.hashtags))))
+        template = POST_PROMPTS.get(post_type, POST_PROMPTS['discussion'])
+        return template.format(topic=topic, tags=tags)
 
     def is_good_posting_time(self):
         """Check if current time is optimal for posting"""
         try:
-            current_hour = datetime.now().hour
-            
-            # Define peak hours (adjust based on your audience)
-            peak_hours = {
-                'weekday': [(7, 9), (12, 14), (17, 22)],  # Morning, Lunch, Evening
-                'weekend': [(9, 22)]  # More relaxed on weekends
-            }
-            
-            is_weekend = datetime.now().weekday() >= 5
-            current_peaks = peak_hours['weekend'] if is_weekend else peak_hours['weekday']
-            
-            # Check if current hour falls within peak times
-            for start, end in current_peaks:
-                if start <= current_hour < end:
-                    return True
+            now = datetime.now()
+            if PEAK_HOURS_MASK >> (now.weekday() * 24 + now.hour) & 1:
+                return True
                     
             # 20% chance to post anyway during off-peak hours
             return random.random() < 0.2
@@ -1012,43 +1709,29 @@ class BlueskyBot:
     def track_follower_count(self):
         """Track follower count over time"""
         try:
-            filename = f"data/{self.name.lower().replace(' ', '_')}_follower_stats.json"
             os.makedirs('data', exist_ok=True)
             
-            # Load existing stats
-            try:
-                with open(filename, 'r') as f:
-                    stats = json.load(f)
-            except FileNotFoundError:
-                stats = {
-                    'snapshots': [],
-                    'last_check': None
-                }
-            
             # Check if 30 minutes have passed since last check
-            current_time = datetime.now()
-            if stats['last_check']:
-                last_check = datetime.fromisoformat(stats['last_check'])
-                if (current_time - last_check).total_seconds() < 1800:  # 1800 seconds = 30 minutes
-                    return
+            current_time = int(time.time())
+            last_check = self.load_follower_meta().get('last_check')
+            if last_check and current_time - last_check < 1800:  # 1800 seconds = 30 minutes
+                return
             
-            # Get current follower count
-            profile = self.client.app.bsky.actor.get_profile({'actor': self.client.me.did})
+            # Get current follower count; drop our cached profile first so the snapshot is fresh
+            self.profile_cache.pop(self.client.me.did)
+            profile = self.get_profile_cached(self.client.me.did)
             follower_count = profile.followers_count
             
-            # Add new snapshot
-            stats['snapshots'].append({
-                'timestamp': str(current_time),
+            # Append the new snapshot; only the small meta file is rewritten
+            snapshot = {
+                'timestamp': current_time,
                 'follower_count': follower_count,
                 'following_count': profile.follows_count,
                 'post_count': profile.posts_count
-            })
-            
-            stats['last_check'] = str(current_time)
-            
-            # Save updated stats
-            with open(filename, 'w') as f:
-                json.dump(stats, f, indent=2)
+            }
+            with open(self.follower_snapshots_file, 'ab') as f:
+                f.write(orjson.dumps(snapshot) + b'\n')
+            self.save_follower_meta({'last_check': current_time})
                 
             print_action(f"[{self.name}] Recorded follower count: {follower_count}")
             self.logger.info(f"Recorded follower count: {follower_count}")
@@ -1057,15 +1740,69 @@ class BlueskyBot:
             print_error(f"[{self.name}] Failed to track follower count: {e}")
             self.logger.error(f"Error tracking follower count: {e}")
 
+    def load_follower_meta(self):
+        """Load follower tracking metadata (last_check)"""
+        try:
+            with open(self.follower_meta_file, 'rb') as f:
+                return orjson.loads(f.read())
+        except FileNotFoundError:
+            return {}
+
+    def save_follower_meta(self, meta):
+        """Atomically replace the follower tracking metadata"""
+        fd, tmp_path = tempfile.mkstemp(dir='data', suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(orjson.dumps(meta))
+        os.replace(tmp_path, self.follower_meta_file)
+
+    def load_follower_stats(self):
+        """Load all follower snapshots, or None if there are none yet"""
+        try:
+            with open(self.follower_snapshots_file, 'rb') as f:
+                snapshots = []
+                for line in f:
+                    try:
+                        snapshots.append(orjson.loads(line))
+                    except orjson.JSONDecodeError:
+                        continue  # e.g. a line cut short by a crash
+        except FileNotFoundError:
+            return None
+        return {
+            'snapshots': snapshots,
+            'last_check': self.load_follower_meta().get('last_check')
+        }
+
+    def migrate_follower_stats(self):
+        """Split an older follower_stats.json into the snapshot log and meta file"""
+        if os.path.exists(self.follower_snapshots_file):
+            return
+        try:
+            with open(f"data/{self.slug}_follower_stats.json", 'rb') as f:
+                stats = orjson.loads(f.read())
+        except FileNotFoundError:
+            return
+            
+        try:
+            # Older files may also store str(datetime) timestamps. The log is written atomically,
+            # since its existence marks the migration as done
+            fd, tmp_path = tempfile.mkstemp(dir='data', suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                for snapshot in stats.get('snapshots', []):
+                    snapshot['timestamp'] = to_epoch(snapshot['timestamp'])
+                    f.write(orjson.dumps(snapshot) + b'\n')
+            if stats.get('last_check'):
+                self.save_follower_meta({'last_check': to_epoch(stats['last_check'])})
+            os.replace(tmp_path, self.follower_snapshots_file)
+            self.logger.info("Migrated follower stats to snapshot log")
+        except Exception as e:
+            print_warning(f"[{self.name}] Failed to migrate follower stats: {e}")
+            self.logger.error(f"Error migrating follower stats: {e}")
+
     def analyze_growth_rate(self):
         """Analyze follower growth rate and provide insights"""
         try:
-            filename = f"data/{self.name.lower().replace(' ', '_')}_follower_stats.json"
-            
-            try:
-                with open(filename, 'r') as f:
-                    stats = json.load(f)
-            except FileNotFoundError:
+            stats = self.load_follower_stats()
+            if stats is None:
                 print_warning(f"[{self.name}] No follower stats found yet")
                 return
                 
@@ -1074,13 +1811,13 @@ class BlueskyBot:
                 print_warning(f"[{self.name}] Not enough data for growth analysis yet")
                 return
                 
-            # Sort snapshots by timestamp
+            # Snapshots are appended in time order, so this sort is a single linear pass
             snapshots.sort(key=lambda x: x['timestamp'])
+            timestamps = [s['timestamp'] for s in snapshots]
             
             # Calculate various metrics
             total_growth = snapshots[-1]['follower_count'] - snapshots[0]['follower_count']
-            time_diff = (datetime.fromisoformat(snapshots[-1]['timestamp']) - 
-                        datetime.fromisoformat(snapshots[0]['timestamp']))
+            time_diff = timedelta(seconds=timestamps[-1] - timestamps[0])
             hours_diff = time_diff.total_seconds() / 3600
             
             # Calculate growth rates
@@ -1093,8 +1830,7 @@ class BlueskyBot:
             engagement_ratio = latest['follower_count'] / latest['following_count'] if latest['following_count'] > 0 else 0
             
             # Get 24-hour growth if we have enough data
-            day_ago = datetime.now() - timedelta(days=1)
-            day_snapshots = [s for s in snapshots if datetime.fromisoformat(s['timestamp']) > day_ago]
+            day_snapshots = snapshots[bisect.bisect_right(timestamps, time.time() - 86400):]
             if day_snapshots:
                 day_growth = day_snapshots[-1]['follower_count'] - day_snapshots[0]['follower_count']
             else:
@@ -1102,7 +1838,7 @@ class BlueskyBot:
             
             # Print analysis
             print_action(f"\n[{self.name}] Growth Rate Analysis:")
-            print(f"""
+            print_report(f"""
 📊 Current Stats:
 • Followers: {latest['follower_count']}
 • Following: {latest['following_count']}
@@ -1121,8 +1857,8 @@ class BlueskyBot:
 • Posts per Follower: {latest['post_count']/latest['follower_count']:.3f}
 
 ⏰ Tracking Period:
-• Start: {snapshots[0]['timestamp']}
-• Latest: {snapshots[-1]['timestamp']}
+• Start: {datetime.fromtimestamp(snapshots[0]['timestamp'])}
+• Latest: {datetime.fromtimestamp(snapshots[-1]['timestamp'])}
 • Duration: {time_diff.days} days, {time_diff.seconds//3600} hours
             """)
             
@@ -1146,17 +1882,15 @@ class BlueskyBot:
     def analyze_engagement_effectiveness(self):
         """Analyze which engagement actions are most effective"""
         try:
-            # Load historical data
-            history = self.load_engagement_history()
-            current_time = datetime.now()
-            
             # Calculate effectiveness for each action type
-            effectiveness = {
-                'follows': self.calculate_action_effectiveness('follows', history),
-                'likes': self.calculate_action_effectiveness('likes', history),
-                'replies': self.calculate_action_effectiveness('replies', history),
-                'reposts': self.calculate_action_effectiveness('reposts', history)
-            }
+            with self.state_lock:
+                history = self.engagement_history
+                effectiveness = {
+                    'follows': self.calculate_action_effectiveness('follows', history),
+                    'likes': self.calculate_action_effectiveness('likes', history),
+                    'replies': self.calculate_action_effectiveness('replies', history),
+                    'reposts': self.calculate_action_effectiveness('reposts', history)
+                }
             
             # Adjust daily limits based on effectiveness
             self.adjust_engagement_limits(effectiveness)
@@ -1223,64 +1957,97 @@ class BlueskyBot:
         try:
             current_followers = self.get_follower_count()
             
-            # Load current tracking period
-            history = self.load_engagement_history()
-            current_period = datetime.now().strftime('%Y-%m-%d-%H')
-            
-            if current_period not in history[action_type]:
-                history[action_type][current_period] = {
-                    'count': 0,
-                    'followers_gained': 0,
-                    'timestamp': str(datetime.now())
-                }
-            
-            # Update counts
-            history[action_type][current_period]['count'] += 1
-            followers_gained = current_followers - self.last_follower_count
-            history[action_type][current_period]['followers_gained'] += max(0, followers_gained)
-            
-            # Save updated history
-            self.save_engagement_history(history)
-            self.last_follower_count = current_followers
+            with self.state_lock:
+                current_period = datetime.now().strftime('%Y-%m-%d-%H')
+                periods = self.engagement_history[action_type]
+                
+                if current_period not in periods:
+                    periods[current_period] = {
+                        'count': 0,
+                        'followers_gained': 0,
+                        'timestamp': int(time.time())
+                    }
+                
+                # Update counts
+                entry = periods[current_period]
+                entry['count'] += 1
+                followers_gained = current_followers - self.last_follower_count
+                entry['followers_gained'] += max(0, followers_gained)
+                self.last_follower_count = current_followers
+                
+                # Log the updated entry; the snapshot is rewritten by the flusher
+                self.engagement_log.write(orjson.dumps(dict(entry, action=action_type, period=current_period)) + b'\n')
+                self.engagement_log.flush()
+                self.dirty['history'] = True
             
         except Exception as e:
             print_error(f"[{self.name}] Error tracking engagement: {e}")
             self.logger.error(f"Error tracking engagement: {e}")
 
     def load_engagement_history(self):
-        """Load or create engagement history tracking file"""
-        filename = f"data/{self.name.lower().replace(' ', '_')}_engagement_history.json"
+        """Load the engagement history snapshot and replay the changes logged since"""
+        filename = self.engagement_history_file
+        log_filename = self.engagement_log_file
         os.makedirs('data', exist_ok=True)
         
+        history = {
+            'follows': {},
+            'likes': {},
+            'replies': {},
+            'reposts': {}
+        }
         try:
-            with open(filename, 'r') as f:
-                history = json.load(f)
-                
-                # Clean up old entries (older than 7 days)
-                current_time = datetime.now()
-                for action_type in history:
-                    history[action_type] = {
-                        period: data for period, data in history[action_type].items()
-                        if (current_time - datetime.fromisoformat(data['timestamp'])).days <= 7
-                    }
-                
-                return history
-                
+            with open(filename, 'rb') as f:
+                history.update(orjson.loads(f.read()))
         except FileNotFoundError:
-            # Initialize new history tracking
-            return {
-                'follows': {},
-                'likes': {},
-                'replies': {},
-                'reposts': {}
-            }
-
-    def save_engagement_history(self, history):
-        """Save engagement history to file"""
+            pass
+            
+        # Each log line holds the latest state of one period, so later lines win
         try:
-            filename = f"data/{self.name.lower().replace(' ', '_')}_engagement_history.json"
-            with open(filename, 'w') as f:
-                json.dump(history, f, indent=2)
+            with open(log_filename, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue  # e.g. a line cut short by a crash
+                    history[entry.pop('action')][entry.pop('period')] = entry
+        except FileNotFoundError:
+            pass
+            
+        self.engagement_log = open(log_filename, 'ab')
+        
+        # Older files store str(datetime); convert them once and rewrite the snapshot
+        legacy = False
+        for periods in history.values():
+            for data in periods.values():
+                if isinstance(data['timestamp'], str):
+                    data['timestamp'] = to_epoch(data['timestamp'])
+                    legacy = True
+        if legacy:
+            self.engagement_history = history
+            self.save_engagement_history()
+        return history
+
+    def save_engagement_history(self):
+        """Write a pruned engagement history snapshot and clear the change log"""
+        try:
+            filename = self.engagement_history_file
+            with self.state_lock:
+                # Drop entries older than 7 days
+                cutoff = time.time() - 7 * 86400
+                for action_type, periods in self.engagement_history.items():
+                    self.engagement_history[action_type] = {
+                        period: data for period, data in periods.items()
+                        if data['timestamp'] >= cutoff
+                    }
+                    
+                fd, tmp_path = tempfile.mkstemp(dir='data', suffix='.tmp')
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(orjson.dumps(self.engagement_history, option=orjson.OPT_INDENT_2))
+                os.replace(tmp_path, filename)
+                
+                # Everything in the log is now part of the snapshot
+                self.engagement_log.truncate(0)
                 
         except Exception as e:
             print_error(f"[{self.name}] Failed to save engagement history: {e}")
@@ -1289,14 +2056,14 @@ class BlueskyBot:
     def save_engagement_config(self):
         """Save current engagement configuration"""
         try:
-            filename = f"data/{self.name.lower().replace(' ', '_')}_engagement_config.json"
+            filename = self.engagement_config_file
             config = {
                 'daily_limits': self.daily_limits,
                 'last_updated': str(datetime.now())
             }
             
-            with open(filename, 'w') as f:
-                json.dump(config, f, indent=2)
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
                 
         except Exception as e:
             print_error(f"[{self.name}] Failed to save engagement config: {e}")
@@ -1305,10 +2072,9 @@ class BlueskyBot:
     def get_follower_count(self):
         """Get current follower count for the bot"""
         try:
-            # Get profile using credentials from config
-            profile = self.client.app.bsky.actor.get_profile({
-                'actor': self.config['credentials']['username']
-            })
+            # Key our own profile by did so it shares a cache entry with track_follower_count
+            me = getattr(self.client, 'me', None)
+            profile = self.get_profile_cached(me.did if me else self.config['credentials']['username'])
             
             # Store follower count in instance variable
             self.last_follower_count = getattr(profile, 'followers_count', 0)
@@ -1319,11 +2085,15 @@ class BlueskyBot:
             self.logger.error(f"Error getting follower count: {e}")
             return self.last_follower_count if hasattr(self, 'last_follower_count') else 0
 
-def run_bot(config_path):
+def create_openai_client():
+    """Create an OpenAI client with a keep-alive connection pool sized for all bots"""
+    http_client = httpx.Client(limits=httpx.Limits(max_connections=64, max_keepalive_connections=64))
+    return OpenAI(http_client=http_client)
+
+def run_bot(config_path, openai_client=None, stop_event=None):
     """Initialize and run a single bot instance"""
     try:
-        bot = BlueskyBot(config_path)
-        bot.login()
+        bot = BlueskyBot(config_path, openai_client, stop_event)  # logs in during init
         bot.run()
     except Exception as e:
         print_error(f"Bot failed to start: {e}")
@@ -1331,6 +2101,10 @@ def run_bot(config_path):
 
 def main():
     """Run all bots from config directory"""
+    # SIGTERM wakes every bot from its sleep so each one shuts down and flushes its state
+    stop_event = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+
     # Find all yaml configs
     config_dir = Path('config')
     config_files = glob.glob(str(config_dir / '*.yaml'))
@@ -1339,30 +2113,32 @@ def main():
         print_error("No configuration files found in config directory!")
         return
     
+    # All bots reuse the same OpenAI connections
+    openai_client = create_openai_client()
+    
     # Create a thread for each bot
     threads = []
     for config_file in config_files:
         print_action(f"Starting bot for config: {config_file}")
         thread = threading.Thread(
             target=run_bot,
-            args=(config_file,),
+            args=(config_file, openai_client, stop_event),
             name=f"bot_{Path(config_file).stem}"
         )
         thread.daemon = True  # Allow program to exit even if threads are running
         threads.append(thread)
         thread.start()
     
-    # Wait for all threads to complete (they won't, since they're infinite loops)
+    # Block until every bot has stopped; signals still interrupt the join
     try:
-        while True:
-            alive_threads = [t for t in threads if t.is_alive()]
-            if not alive_threads:
-                break
-            for thread in alive_threads:
-                thread.join(timeout=1.0)
+        for thread in threads:
+            thread.join()
     except KeyboardInterrupt:
         print_action("\nShutting down all bots...")
-        # Each bot will handle its own cleanup in its run loop
+        stop_event.set()
+        # Give each bot a moment to finish its cleanup
+        for thread in threads:
+            thread.join(timeout=30)
     finally:
         print_success("All bots stopped!")
 